@@ -4,6 +4,7 @@ Uses customtkinter for modern Material Design-like appearance
 
 Installation:
     pip install customtkinter pillow plyer
+    pip install orjson  # optional, faster JSON encoding
 
 Usage:
     python modern_gui.py
@@ -12,10 +13,19 @@ Usage:
 import os
 import json
 import csv
+import functools
+from concurrent.futures import ThreadPoolExecutor
 import threading
 import time
 import hashlib
-from datetime import datetime, timedelta
+import heapq
+import hmac
+import mmap
+import re
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field, fields
+from operator import attrgetter
+from datetime import datetime
 from typing import Dict, List, Optional
 import tkinter as tk
 from tkinter import messagebox, ttk
@@ -32,32 +42,152 @@ except ImportError:
     from plyer import notification
     HAS_PLYER = True
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 ctk.set_appearance_mode("dark")
 ctk.set_default_color_theme("blue")
 
+SCRYPT_N, SCRYPT_R, SCRYPT_P = 2 ** 14, 8, 1
+DUMMY_SALT = bytes(16)
+LOGIN_MAX_FAILURES = 5
+LOGIN_COOLDOWN = 30
+ALERT_FLUSH_INTERVAL = 60
+ALERT_MAX_SLEEP = 60
+COMPACT_MIN_OPS = 1000
+COMPACT_RATIO = 2
+USER_ROW_HEIGHT = 54
+USER_ROW_BUFFER = 5
+USER_RENDER_CHUNK = 20
+USERS_LIST_BG = "#212121"
+USERS_WHEEL_TAG = "UsersListWheel"
+EVENTS_WHEEL_TAG = "EventsTreeWheel"
+BADGE_COLORS = {"admin": "#3b82f6"}
+USER_CARD_KW = {"fg_color": "#2b2b2b", "corner_radius": 8, "height": USER_ROW_HEIGHT - 10}
+
+@dataclass(slots=True, eq=False)
+class Event:
+    id: int
+    timestamp: str = ""
+    date: str = ""
+    time_slot: str = ""
+    length: str = ""
+    client: str = ""
+    delivery_type: str = ""
+    resource: str = ""
+    assigned_to: str = ""
+    signature: str = ""
+    notes: str = ""
+    status: str = "logged"
+    alert_minutes: int = 5
+    alert_triggered: bool = False
+    last_modified: str = ""
+    _client_lc: str = field(default="", init=False, repr=False, compare=False)
+    _start_min: Optional[int] = field(default=None, init=False, repr=False, compare=False)
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "Event":
+        return cls(**{k: data[k] for k in EVENT_FIELDS if k in data})
+
+    def to_dict(self) -> Dict:
+        return dict(zip(EVENT_FIELDS, _event_row(self)))
+
+EVENT_FIELDS = tuple(f.name for f in fields(Event) if f.init)
+_event_row = attrgetter(*EVENT_FIELDS)
+EVENT_COLUMNS = (
+    ("id", "#", 50), ("time_slot", "Time Slot", 110), ("client", "Client", 180),
+    ("delivery_type", "Type", 120), ("resource", "Resource", 140),
+    ("assigned_to", "Assigned To", 130), ("notes", "Notes", 240)
+)
+
+_json_cache = {}
+_json_cache_lock = threading.Lock()
+
+def _read_json(filename: str):
+    with open(filename, 'rb') as f:
+        if not HAS_ORJSON:
+            return json.load(f)
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+            return orjson.loads(view)
+
+def load_json_file(filename: str, default):
+    try:
+        st = os.stat(filename)
+    except FileNotFoundError:
+        return default
+    with _json_cache_lock:
+        cached = _json_cache.get(filename)
+        if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            return cached[2]
+        try:
+            data = _read_json(filename)
+        except ValueError:
+            return default
+        _json_cache[filename] = (st.st_mtime_ns, st.st_size, data)
+        return data
+
+def _dumps(data) -> bytes:
+    if HAS_ORJSON:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(',', ':')).encode()
+
+def _loads(buf: bytes):
+    if HAS_ORJSON:
+        return orjson.loads(buf)
+    return json.loads(buf)
+
+def _read_lines(filename: str):
+    with open(filename, 'rb') as f:
+        if not HAS_ORJSON or os.fstat(f.fileno()).st_size == 0:
+            yield from f
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            yield from iter(mm.readline, b'')
+
+def save_json_file(filename: str, data):
+    buf = _dumps(data)
+    tmp = filename + '.tmp'
+    with _json_cache_lock:
+        with open(tmp, 'wb') as f:
+            f.write(buf)
+        os.replace(tmp, filename)
+        st = os.stat(filename)
+        _json_cache[filename] = (st.st_mtime_ns, st.st_size, data)
+
+@functools.lru_cache(maxsize=128)
+def _parse_scrypt_hash(stored: str):
+    _, n, r, p, salt, digest = stored.split('$')
+    return int(n), int(r), int(p), bytes.fromhex(salt), bytes.fromhex(digest)
+
 class User:
     def __init__(self, users_file: str = "users.json"):
         self.users_file = users_file
         self.users = self._load_users()
         self.current_user = None
+        self._failures = {}
         if not self.users:
             self._create_default_users()
 
     def _load_users(self) -> Dict:
-        if os.path.exists(self.users_file):
-            try:
-                with open(self.users_file, 'r') as f:
-                    return json.load(f)
-            except json.JSONDecodeError:
-                return {}
-        return {}
+        return load_json_file(self.users_file, {})
 
     def _save_users(self):
-        with open(self.users_file, 'w') as f:
-            json.dump(self.users, f, indent=2)
+        save_json_file(self.users_file, self.users)
 
-    def _hash_password(self, password: str) -> str:
-        return hashlib.sha256(password.encode()).hexdigest()
+    def _hash_password(self, password: str, salt: Optional[bytes] = None) -> str:
+        salt = salt or os.urandom(16)
+        digest = hashlib.scrypt(password.encode(), salt=salt, n=SCRYPT_N, r=SCRYPT_R, p=SCRYPT_P, dklen=32)
+        return f"scrypt${SCRYPT_N}${SCRYPT_R}${SCRYPT_P}${salt.hex()}${digest.hex()}"
+
+    def _verify_password(self, stored: str, password: str) -> bool:
+        if not stored.startswith("scrypt$"):
+            return hmac.compare_digest(stored, hashlib.sha256(password.encode()).hexdigest())
+        n, r, p, salt, expected = _parse_scrypt_hash(stored)
+        candidate = hashlib.scrypt(password.encode(), salt=salt, n=n, r=r, p=p, dklen=len(expected))
+        return hmac.compare_digest(candidate, expected)
 
     def _create_default_users(self):
         self.users = {
@@ -67,10 +197,29 @@ class User:
         self._save_users()
 
     def authenticate(self, username: str, password: str) -> bool:
-        if username in self.users:
-            if self.users[username]['password'] == self._hash_password(password):
+        now = time.monotonic()
+        failures, last_failure = self._failures.get(username, (0, 0.0))
+        if now - last_failure >= LOGIN_COOLDOWN:
+            failures = 0
+        if failures >= LOGIN_MAX_FAILURES:
+            return False
+        if username not in self.users:
+            self._hash_password(password, DUMMY_SALT)
+        else:
+            stored = self.users[username].get('password', '')
+            if self._verify_password(stored, password):
+                if not stored.startswith("scrypt$"):
+                    self.users[username]['password'] = self._hash_password(password)
+                    try:
+                        self._save_users()
+                    except OSError:
+                        pass
+                self._failures.pop(username, None)
                 self.current_user = username
                 return True
+            self._failures = {name: entry for name, entry in self._failures.items()
+                              if now - entry[1] < LOGIN_COOLDOWN}
+            self._failures[username] = (failures + 1, now)
         return False
 
     def get_role(self, username: str) -> Optional[str]:
@@ -87,142 +236,328 @@ class User:
         return True
 
     def list_users(self):
+        self.users = load_json_file(self.users_file, self.users)
         return self.users
 
     def get_name(self, username: str) -> str:
         return self.users.get(username, {}).get('name', username)
 
 class ScheduleLogger:
-    def __init__(self, log_file: str = "schedule_log.json"):
+    _TIME_RE = re.compile(r'\s*(\d{1,2}):(\d{1,2})\s*(?:-|$)')
+
+    def __init__(self, log_file: str = "schedule_log.jsonl"):
         self.log_file = log_file
-        self.events = self._load_events()
+        self._op_count = 0
+        self._pending_ops = []
+        self._write_lock = threading.Lock()
+        self._load_lock = threading.Lock()
+        self._events = None
+        self.revision = 0
+        self._schedule_key = None
+        self._schedule = None
         self.alert_running = False
         self.alert_thread = None
         self.alert_callback = None
+        self._wakeup = threading.Event()
+        self._alerts_dirty = False
+        self._last_flush = 0.0
 
-    def _load_events(self) -> List[Dict]:
-        if os.path.exists(self.log_file):
+    @property
+    def events(self) -> List[Event]:
+        if self._events is None:
+            self._ensure_loaded()
+        return self._events
+
+    def _ensure_loaded(self):
+        if self._events is not None:
+            return
+        with self._load_lock:
+            if self._events is None:
+                self._load()
+
+    def _load(self):
+        migrated = not os.path.exists(self.log_file)
+        records, next_id = self._load_events()
+        events = [Event.from_dict(d) for d in records]
+        by_date = defaultdict(list)
+        for e in events:
+            e._client_lc = e.client.lower()
+            e._start_min = self._start_minutes(e.time_slot)
+        events.sort(key=attrgetter('timestamp'))
+        for e in events:
+            by_date[e.date].append(e)
+        self._by_id = {e.id: e for e in events}
+        self._by_date = by_date
+        self._next_id_counter = max(next_id, max(self._by_id, default=0) + 1)
+        self._sorted_ok = True
+        self._client_counts = Counter(map(attrgetter('client'), events))
+        self._delivery_counts = Counter(map(attrgetter('delivery_type'), events))
+        self._events = events
+        if migrated and events:
+            self.compact()
+
+    def _load_events(self):
+        if not os.path.exists(self.log_file):
+            try:
+                return _read_json(os.path.splitext(self.log_file)[0] + '.json'), 1
+            except (FileNotFoundError, ValueError):
+                return [], 1
+        events = {}
+        next_id = 1
+        offset = 0
+        tail_ok = True
+        for line in _read_lines(self.log_file):
             try:
-                with open(self.log_file, 'r') as f:
-                    return json.load(f)
-            except json.JSONDecodeError:
-                return []
-        return []
+                op = _loads(line)
+                tail_ok = True
+            except ValueError:
+                tail_ok = False
+                offset += len(line)
+                continue
+            offset += len(line)
+            self._op_count += 1
+            kind = op.get('op')
+            if kind == 'add':
+                events[op['event']['id']] = op['event']
+                next_id = max(next_id, op['event']['id'] + 1)
+            elif kind == 'meta':
+                next_id = max(next_id, op['next_id'])
+            elif kind == 'update' and op['id'] in events:
+                events[op['id']].update(op['fields'])
+            elif kind == 'del':
+                events.pop(op['id'], None)
+        if offset and not line.endswith(b'\n'):
+            if tail_ok:
+                with open(self.log_file, 'ab') as f:
+                    f.write(b'\n')
+            else:
+                os.truncate(self.log_file, offset - len(line))
+        return list(events.values()), next_id
+
+    def _log_op(self, op: Dict, alert: bool = False):
+        with self._write_lock:
+            self._pending_ops.append(op)
+            if alert:
+                self._alerts_dirty = True
+
+    def compact(self):
+        with self._write_lock:
+            meta = _dumps({"op": "meta", "next_id": self._next_id_counter}) + b'\n'
+            buf = meta + b''.join(_dumps({"op": "add", "event": e.to_dict()}) + b'\n' for e in self.events)
+            tmp = self.log_file + '.tmp'
+            with open(tmp, 'wb') as f:
+                f.write(buf)
+            os.replace(tmp, self.log_file)
+            self._pending_ops.clear()
+            self._op_count = len(self.events) + 1
 
     def _save_events(self):
-        with open(self.log_file, 'w') as f:
-            json.dump(self.events, f, indent=2)
+        with self._write_lock:
+            ops, self._pending_ops = self._pending_ops, []
+            if ops:
+                with open(self.log_file, 'ab') as f:
+                    f.write(b''.join(_dumps(op) + b'\n' for op in ops))
+                self._op_count += len(ops)
+            self._alerts_dirty = False
+        self._last_flush = time.monotonic()
+        if self._op_count >= COMPACT_MIN_OPS and self._op_count > COMPACT_RATIO * len(self.events):
+            self.compact()
+
+    def flush(self):
+        self._flush_alerts(force=True)
+
+    def _flush_alerts(self, force: bool = False):
+        if self._alerts_dirty and (force or time.monotonic() - self._last_flush >= ALERT_FLUSH_INTERVAL):
+            self._save_events()
+
+    def _ensure_sorted(self):
+        if not self._sorted_ok:
+            key = attrgetter('timestamp')
+            self.events.sort(key=key)
+            for bucket in self._by_date.values():
+                bucket.sort(key=key)
+            self._sorted_ok = True
+
+    def _tally(self, event: Event, delta: int):
+        for counts, key in ((self._client_counts, 'client'), (self._delivery_counts, 'delivery_type')):
+            value = getattr(event, key)
+            counts[value] += delta
+            if not counts[value]:
+                del counts[value]
 
     def _next_id(self):
-        if not self.events:
-            return 1
-        return max(e['id'] for e in self.events) + 1
+        next_id = self._next_id_counter
+        self._next_id_counter += 1
+        return next_id
 
     def add_event(self, time_slot: str, client: str, delivery_type: str, resource: str,
                   assigned_to: str, signature: str = "", length: str = "",
-                  notes: str = "", alert_minutes: int = 5) -> Dict:
-        event = {
-            "id": self._next_id(),
-            "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-            "date": datetime.now().strftime("%Y-%m-%d"),
-            "time_slot": time_slot,
-            "length": length,
-            "client": client,
-            "delivery_type": delivery_type,
-            "resource": resource,
-            "assigned_to": assigned_to,
-            "signature": signature,
-            "notes": notes,
-            "status": "logged",
-            "alert_minutes": alert_minutes,
-            "alert_triggered": False
-        }
+                  notes: str = "", alert_minutes: int = 5) -> Event:
+        self._ensure_loaded()
+        event = Event(
+            id=self._next_id(),
+            timestamp=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            date=datetime.now().strftime("%Y-%m-%d"),
+            time_slot=time_slot,
+            length=length,
+            client=client,
+            delivery_type=delivery_type,
+            resource=resource,
+            assigned_to=assigned_to,
+            signature=signature,
+            notes=notes,
+            alert_minutes=alert_minutes
+        )
+        event._client_lc = client.lower()
+        event._start_min = self._start_minutes(time_slot)
+        if self.events and self.events[-1].timestamp > event.timestamp:
+            self._sorted_ok = False
         self.events.append(event)
+        self._by_id[event.id] = event
+        self._tally(event, 1)
+        self._by_date[event.date].append(event)
+        self.revision += 1
+        self._log_op({"op": "add", "event": event.to_dict()})
+        self._wakeup.set()
         self._save_events()
         return event
 
-    def view_events(self, date: Optional[str] = None, client: Optional[str] = None) -> List[Dict]:
-        filtered = self.events
-        if date:
-            filtered = [e for e in filtered if e['date'] == date]
+    def get_event(self, event_id: int) -> Optional[Event]:
+        self._ensure_loaded()
+        return self._by_id.get(event_id)
+
+    def view_events(self, date: Optional[str] = None, client: Optional[str] = None) -> List[Event]:
+        self._ensure_loaded()
+        self._ensure_sorted()
+        filtered = self._by_date.get(date, []) if date else self.events
         if client:
-            filtered = [e for e in filtered if client.lower() in e['client'].lower()]
-        return sorted(filtered, key=lambda x: x.get('timestamp', ''), reverse=True)
+            needle = client.lower()
+            filtered = [e for e in filtered if needle in e._client_lc]
+        return filtered[::-1]
 
     def update_event(self, event_id: int, **kwargs) -> bool:
-        for event in self.events:
-            if event['id'] == event_id:
-                event.update(kwargs)
-                event['last_modified'] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                self._save_events()
-                return True
-        return False
+        self._ensure_loaded()
+        unknown = [key for key in kwargs if key == 'id' or key not in EVENT_FIELDS]
+        if unknown:
+            raise ValueError(f"Cannot update event fields: {', '.join(unknown)}")
+        event = self._by_id.get(event_id)
+        if event is None:
+            return False
+        old_date = event.date
+        kwargs['last_modified'] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        self._tally(event, -1)
+        for key, value in kwargs.items():
+            setattr(event, key, value)
+        self._tally(event, 1)
+        if event.date != old_date:
+            self._by_date[old_date].remove(event)
+            self._by_date[event.date].append(event)
+            self._sorted_ok = False
+        if 'timestamp' in kwargs:
+            self._sorted_ok = False
+        if 'client' in kwargs:
+            event._client_lc = event.client.lower()
+        if 'time_slot' in kwargs:
+            event._start_min = self._start_minutes(event.time_slot)
+        self.revision += 1
+        self._log_op({"op": "update", "id": event_id, "fields": kwargs})
+        self._wakeup.set()
+        self._save_events()
+        return True
 
     def delete_event(self, event_id: int) -> bool:
-        for i, event in enumerate(self.events):
-            if event['id'] == event_id:
-                self.events.pop(i)
-                self._save_events()
-                return True
-        return False
+        self._ensure_loaded()
+        event = self._by_id.pop(event_id, None)
+        if event is None:
+            return False
+        self.events.remove(event)
+        self._by_date[event.date].remove(event)
+        self._tally(event, -1)
+        self.revision += 1
+        self._log_op({"op": "del", "id": event_id})
+        self._save_events()
+        return True
 
     def export_to_csv(self, filename: str = "schedule_export.csv"):
         if not self.events:
             return False
-        keys = self.events[0].keys()
-        with open(filename, 'w', newline='') as f:
-            writer = csv.DictWriter(f, fieldnames=keys)
-            writer.writeheader()
-            writer.writerows(self.events)
+        with open(filename, 'w', newline='', encoding='utf-8', buffering=1 << 20) as f:
+            writer = csv.writer(f)
+            writer.writerow(EVENT_FIELDS)
+            writer.writerows(map(_event_row, list(self.events)))
         return True
 
     def get_summary(self, date: Optional[str] = None) -> Dict:
-        events = self.view_events(date=date)
-        clients = {}
-        delivery_types = {}
-        for event in events:
-            clients[event['client']] = clients.get(event['client'], 0) + 1
-            delivery_types[event['delivery_type']] = delivery_types.get(event['delivery_type'], 0) + 1
+        self._ensure_loaded()
+        if date:
+            events = self._by_date.get(date, [])
+            clients = Counter(map(attrgetter('client'), events))
+            delivery_types = Counter(map(attrgetter('delivery_type'), events))
+        else:
+            events = self.events
+            clients = self._client_counts
+            delivery_types = self._delivery_counts
         return {
             "total_events": len(events),
-            "clients": clients,
-            "delivery_types": delivery_types,
+            "clients": dict(clients),
+            "delivery_types": dict(delivery_types),
             "date_range": date or "all time"
         }
 
+    def recent_events(self, limit: int = 5) -> List[Event]:
+        self._ensure_loaded()
+        self._ensure_sorted()
+        return self.events[:-limit - 1:-1]
+
     def parse_time_slot(self, time_slot: str) -> Optional[datetime]:
-        try:
-            start_time = time_slot.split('-')[0].strip()
-            today = datetime.now().date()
-            event_time = datetime.strptime(f"{today} {start_time}", "%Y-%m-%d %H:%M")
-            return event_time
-        except Exception:
+        start_min = self._start_minutes(time_slot)
+        if start_min is None:
+            return None
+        today = datetime.now().date()
+        return datetime(today.year, today.month, today.day, start_min // 60, start_min % 60)
+
+    def _start_minutes(self, time_slot: str) -> Optional[int]:
+        m = self._TIME_RE.match(time_slot)
+        if not m:
             return None
+        hours, minutes = int(m.group(1)), int(m.group(2))
+        if hours > 23 or minutes > 59:
+            return None
+        return hours * 60 + minutes
+
+    def _alert_schedule(self, today: str):
+        self._ensure_loaded()
+        if self._schedule_key != (today, self.revision):
+            self._schedule = [(e._start_min - e.alert_minutes, e._start_min, e.id, e)
+                              for e in self._by_date.get(today, ())
+                              if not e.alert_triggered and e._start_min is not None]
+            heapq.heapify(self._schedule)
+            self._schedule_key = (today, self.revision)
+        return self._schedule
 
     def check_alerts(self):
         now = datetime.now()
         today = now.strftime("%Y-%m-%d")
-        for event in self.events:
-            if event['date'] != today or event.get('alert_triggered'):
+        now_min = now.hour * 60 + now.minute
+        schedule = self._alert_schedule(today)
+        while schedule and schedule[0][0] <= now_min:
+            _, start_min, _, event = heapq.heappop(schedule)
+            if start_min <= now_min:
                 continue
-            event_time = self.parse_time_slot(event['time_slot'])
-            if not event_time:
-                continue
-            alert_time = event_time - timedelta(minutes=event.get('alert_minutes', 5))
-            if now >= alert_time and now < event_time:
-                if HAS_PLYER:
-                    try:
-                        notification.notify(
-                            title=f"Event Alert #{event['id']}",
-                            message=f"{event['client']} - {event['time_slot']}",
-                            timeout=10
-                        )
-                    except Exception:
-                        pass
-                if self.alert_callback:
-                    self.alert_callback(event)
-                event['alert_triggered'] = True
-                self._save_events()
+            if HAS_PLYER:
+                try:
+                    notification.notify(
+                        title=f"Event Alert #{event.id}",
+                        message=f"{event.client} - {event.time_slot}",
+                        timeout=10
+                    )
+                except Exception:
+                    pass
+            if self.alert_callback:
+                self.alert_callback(event)
+            event.alert_triggered = True
+            self._log_op({"op": "update", "id": event.id, "fields": {"alert_triggered": True}}, alert=True)
+        self._flush_alerts()
 
     def start_alert_monitor(self, callback=None):
         if self.alert_running:
@@ -238,38 +573,92 @@ class ScheduleLogger:
             return False
         self.alert_running = False
         self.alert_callback = None
+        self._wakeup.set()
+        self._flush_alerts(force=True)
         return True
 
+    def _seconds_until_next_alert(self) -> float:
+        now = datetime.now()
+        now_sec = now.hour * 3600 + now.minute * 60 + now.second + now.microsecond / 1e6
+        schedule = self._alert_schedule(now.strftime("%Y-%m-%d"))
+        timeout = min(ALERT_MAX_SLEEP, 86400 - now_sec)
+        if schedule:
+            timeout = min(timeout, schedule[0][0] * 60 - now_sec)
+        if self._alerts_dirty:
+            timeout = min(timeout, ALERT_FLUSH_INTERVAL - (time.monotonic() - self._last_flush))
+        return max(0.0, timeout)
+
     def _alert_loop(self):
-        while self.alert_running:
+        while self.alert_running and self.alert_thread is threading.current_thread():
             self.check_alerts()
-            time.sleep(30)
+            self._wakeup.wait(self._seconds_until_next_alert())
+            self._wakeup.clear()
+        self._flush_alerts(force=True)
 
     def reset_alerts_for_today(self):
+        self._ensure_loaded()
         today = datetime.now().strftime("%Y-%m-%d")
-        for event in self.events:
-            if event['date'] == today:
-                event['alert_triggered'] = False
+        for event in self._by_date.get(today, ()):
+            if event.alert_triggered:
+                event.alert_triggered = False
+                self._log_op({"op": "update", "id": event.id, "fields": {"alert_triggered": False}})
+        self._schedule_key = None
+        self._wakeup.set()
         self._save_events()
         return True
 
+def _wheel_step(event) -> int:
+    return -1 if event.num == 4 or event.delta > 0 else 1
+
+def batched_layout(method):
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        self.content_area.pack_forget()
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            self.content_area.pack(side="left", fill="both", expand=True)
+    return wrapper
+
 class ModernGUI:
     def __init__(self):
         self.root = ctk.CTk()
         self.root.title("Schedule Event Logging System")
         self.root.geometry("1200x700")
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+        
+        style = ttk.Style(self.root)
+        style.theme_use("default")
+        style.configure("Events.Treeview", background="#2b2b2b", foreground="white",
+                        fieldbackground="#2b2b2b", rowheight=28, borderwidth=0, font=("Arial", 12))
+        style.configure("Events.Treeview.Heading", background="#1f538d", foreground="white",
+                        relief="flat", font=("Arial", 12, "bold"))
+        style.map("Events.Treeview", background=[("selected", "#3b82f6")])
         
         self.user_mgmt = User()
         self.logger = ScheduleLogger()
         self.current_user = None
+        self._events_render_key = None
+        self._dashboard = None
+        self._users_render_gen = 0
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.root.bind_class(USERS_WHEEL_TAG, sequence, self._scroll_users)
+            self.root.bind_class(EVENTS_WHEEL_TAG, sequence, self._scroll_events)
+        self._pool = ThreadPoolExecutor(max_workers=2)
+        self._user_name_font = ctk.CTkFont(family="Arial", size=15, weight="bold")
+        self._user_badge_font = ctk.CTkFont(family="Arial", size=11, weight="bold")
+        badge_kw = {"font": self._user_badge_font, "corner_radius": 6, "width": 60, "height": 24}
+        self._badge_kw = {role: {**badge_kw, "fg_color": color} for role, color in BADGE_COLORS.items()}
+        self._default_badge_kw = {**badge_kw, "fg_color": "#6b7280"}
         
         self.main_container = None
+        self._page_container = None
         self.show_login()
         
     def show_login(self):
-        self.clear_window()
+        self.clear_root()
         
-        login_frame = ctk.CTkFrame(self.root)
+        login_frame = ctk.CTkFrame(self._page_container)
         login_frame.pack(expand=True, fill="both", padx=50, pady=50)
         
         ctk.CTkLabel(
@@ -300,25 +689,43 @@ class ModernGUI:
         error_label.pack()
         
         def attempt_login():
+            if sign_in_button.cget("state") == "disabled":
+                return
             username = username_entry.get()
             password = password_entry.get()
+            sign_in_button.configure(state="disabled")
             
-            if self.user_mgmt.authenticate(username, password):
+            def verify():
+                try:
+                    ok = self.user_mgmt.authenticate(username, password)
+                except Exception:
+                    ok = None
+                self.root.after(0, lambda: finish_login(username, ok))
+            
+            threading.Thread(target=verify, daemon=True).start()
+        
+        def finish_login(username, ok):
+            if ok:
                 self.current_user = username
                 self.show_dashboard()
             else:
-                error_label.configure(text="Invalid username or password")
+                sign_in_button.configure(state="normal")
+                if ok is None:
+                    error_label.configure(text="Login failed, please try again")
+                else:
+                    error_label.configure(text="Invalid username or password")
         
         password_entry.bind("<Return>", lambda e: attempt_login())
         
-        ctk.CTkButton(
+        sign_in_button = ctk.CTkButton(
             input_frame,
             text="Sign In",
             width=300,
             height=40,
             font=("Arial", 16, "bold"),
             command=attempt_login
-        ).pack(pady=10)
+        )
+        sign_in_button.pack(pady=10)
         
         ctk.CTkLabel(
             login_frame,
@@ -328,9 +735,9 @@ class ModernGUI:
         ).pack(side="bottom", pady=20)
     
     def show_dashboard(self):
-        self.clear_window()
+        self.clear_root()
         
-        self.main_container = ctk.CTkFrame(self.root)
+        self.main_container = ctk.CTkFrame(self._page_container)
         self.main_container.pack(fill="both", expand=True)
         
         header = ctk.CTkFrame(self.main_container, height=70, fg_color="#1f538d")
@@ -383,8 +790,9 @@ class ModernGUI:
         if self.user_mgmt.is_admin(self.current_user):
             menu_buttons.append(("Manage Users", lambda: self.show_content_users()))
         
+        self._menu_buttons = {}
         for text, command in menu_buttons:
-            ctk.CTkButton(
+            button = ctk.CTkButton(
                 sidebar,
                 text=text,
                 width=180,
@@ -394,7 +802,9 @@ class ModernGUI:
                 hover_color="#1f538d",
                 anchor="w",
                 command=command
-            ).pack(pady=5, padx=10)
+            )
+            button.pack(pady=5, padx=10)
+            self._menu_buttons[text] = button
         
         self.content_area = ctk.CTkScrollableFrame(content)
         self.content_area.pack(side="left", fill="both", expand=True)
@@ -405,14 +815,18 @@ class ModernGUI:
     def on_alert(self, event):
         def show_alert():
             messagebox.showinfo(
-                f"Event Alert #{event['id']}",
-                f"Client: {event['client']}\nTime: {event['time_slot']}\nResource: {event['resource']}"
+                f"Event Alert #{event.id}",
+                f"Client: {event.client}\nTime: {event.time_slot}\nResource: {event.resource}"
             )
         self.root.after(0, show_alert)
     
+    @batched_layout
     def show_content_dashboard(self):
-        for widget in self.content_area.winfo_children():
-            widget.destroy()
+        if self._dashboard and self._dashboard['root'].winfo_exists():
+            self._update_dashboard()
+            return
+        
+        self.clear_content()
         
         ctk.CTkLabel(
             self.content_area,
@@ -420,27 +834,28 @@ class ModernGUI:
             font=("Arial", 28, "bold")
         ).pack(anchor="w", pady=(0, 20))
         
-        summary = self.logger.get_summary()
-        
         stats_frame = ctk.CTkFrame(self.content_area)
         stats_frame.pack(fill="x", pady=10)
         
         stats = [
-            ("Total Events", str(summary['total_events']), "#3b82f6"),
-            ("Unique Clients", str(len(summary['clients'])), "#10b981"),
-            ("Delivery Types", str(len(summary['delivery_types'])), "#f59e0b"),
+            ("Total Events", "#3b82f6"),
+            ("Unique Clients", "#10b981"),
+            ("Delivery Types", "#f59e0b"),
         ]
         
-        for i, (label, value, color) in enumerate(stats):
+        value_labels = []
+        for label, color in stats:
             stat_card = ctk.CTkFrame(stats_frame, fg_color=color, corner_radius=10)
             stat_card.pack(side="left", expand=True, fill="both", padx=5, pady=5)
             
-            ctk.CTkLabel(
+            value_label = ctk.CTkLabel(
                 stat_card,
-                text=value,
+                text="",
                 font=("Arial", 36, "bold"),
                 text_color="white"
-            ).pack(pady=(20, 0))
+            )
+            value_label.pack(pady=(20, 0))
+            value_labels.append(value_label)
             
             ctk.CTkLabel(
                 stat_card,
@@ -458,38 +873,53 @@ class ModernGUI:
             font=("Arial", 20, "bold")
         ).pack(anchor="w", padx=20, pady=(20, 10))
         
-        recent_events = self.logger.view_events()[:5]
+        self._dashboard = {
+            "root": stats_frame,
+            "stats": value_labels,
+            "cards": [self._make_recent_card(recent_frame) for _ in range(5)]
+        }
+        self._update_dashboard()
+    
+    def _make_recent_card(self, parent):
+        event_card = ctk.CTkFrame(parent, fg_color="#2b2b2b", corner_radius=8)
         
-        for event in recent_events:
-            event_card = ctk.CTkFrame(recent_frame, fg_color="#2b2b2b", corner_radius=8)
-            event_card.pack(fill="x", padx=20, pady=5)
-            
-            info_frame = ctk.CTkFrame(event_card, fg_color="transparent")
-            info_frame.pack(fill="x", padx=15, pady=10)
-            
-            ctk.CTkLabel(
-                info_frame,
-                text=f"#{event['id']} - {event['client']}",
-                font=("Arial", 16, "bold")
-            ).pack(side="left")
-            
-            ctk.CTkLabel(
-                info_frame,
-                text=event['time_slot'],
-                font=("Arial", 14),
-                text_color="gray"
-            ).pack(side="right")
-            
-            ctk.CTkLabel(
-                event_card,
-                text=f"Type: {event['delivery_type']} | Resource: {event['resource']} | Assigned: {event['assigned_to']}",
-                font=("Arial", 12),
-                text_color="gray"
-            ).pack(anchor="w", padx=15, pady=(0, 10))
+        info_frame = ctk.CTkFrame(event_card, fg_color="transparent")
+        info_frame.pack(fill="x", padx=15, pady=10)
+        
+        title = ctk.CTkLabel(info_frame, text="", font=("Arial", 16, "bold"))
+        title.pack(side="left")
+        
+        slot = ctk.CTkLabel(info_frame, text="", font=("Arial", 14), text_color="gray")
+        slot.pack(side="right")
+        
+        details = ctk.CTkLabel(event_card, text="", font=("Arial", 12), text_color="gray")
+        details.pack(anchor="w", padx=15, pady=(0, 10))
+        
+        return {"frame": event_card, "title": title, "slot": slot, "details": details}
     
+    def _update_dashboard(self):
+        summary = self.logger.get_summary()
+        values = (summary['total_events'], len(summary['clients']), len(summary['delivery_types']))
+        for value_label, value in zip(self._dashboard['stats'], values):
+            value_label.configure(text=str(value))
+        
+        cards = self._dashboard['cards']
+        recent_events = self.logger.recent_events(len(cards))
+        for i, card in enumerate(cards):
+            if i >= len(recent_events):
+                card['frame'].pack_forget()
+                continue
+            event = recent_events[i]
+            card['title'].configure(text=f"#{event.id} - {event.client}")
+            card['slot'].configure(text=event.time_slot)
+            card['details'].configure(
+                text=f"Type: {event.delivery_type} | Resource: {event.resource} | Assigned: {event.assigned_to}"
+            )
+            card['frame'].pack(fill="x", padx=20, pady=5)
+    
+    @batched_layout
     def show_content_events(self):
-        for widget in self.content_area.winfo_children():
-            widget.destroy()
+        self.clear_content()
         
         ctk.CTkLabel(
             self.content_area,
@@ -509,7 +939,7 @@ class ModernGUI:
         def apply_filter():
             date_val = date_entry.get() if date_entry.get() else None
             client_val = client_entry.get() if client_entry.get() else None
-            self.refresh_events_list(events_list_frame, date_val, client_val)
+            self.refresh_events_list(tree, date_val, client_val)
         
         ctk.CTkButton(filter_frame, text="Filter", command=apply_filter, width=100).pack(side="left", padx=5)
         ctk.CTkButton(
@@ -520,87 +950,75 @@ class ModernGUI:
             fg_color="gray"
         ).pack(side="left", padx=5)
         
-        events_list_frame = ctk.CTkFrame(self.content_area)
-        events_list_frame.pack(fill="both", expand=True)
+        list_frame = ctk.CTkFrame(self.content_area)
+        list_frame.pack(fill="both", expand=True)
+        
+        tree = ttk.Treeview(
+            list_frame,
+            columns=[key for key, _, _ in EVENT_COLUMNS],
+            show="headings",
+            height=18,
+            style="Events.Treeview"
+        )
+        for key, heading, width in EVENT_COLUMNS:
+            tree.heading(key, text=heading, anchor="w")
+            tree.column(key, width=width, anchor="w", stretch=(key == "notes"))
+        
+        scrollbar = ctk.CTkScrollbar(list_frame, command=tree.yview)
+        tree.configure(yscrollcommand=scrollbar.set)
+        tree.bindtags((EVENTS_WHEEL_TAG,) + tree.bindtags())
+        scrollbar.pack(side="right", fill="y")
+        tree.pack(side="left", fill="both", expand=True)
+        
+        def selected_id():
+            selection = tree.selection()
+            return int(selection[0]) if selection else None
+        
+        def edit_selected():
+            event_id = selected_id()
+            if event_id is not None:
+                self.show_edit_event(self.logger.get_event(event_id))
+        
+        def delete_selected():
+            event_id = selected_id()
+            if event_id is not None:
+                self.delete_event(event_id)
+        
+        tree.bind("<Double-Button-1>", lambda e: edit_selected())
         
-        self.refresh_events_list(events_list_frame)
-    
-    def refresh_events_list(self, container, date=None, client=None):
-        for widget in container.winfo_children():
-            widget.destroy()
-        
-        events = self.logger.view_events(date=date, client=client)
+        ctk.CTkButton(
+            filter_frame,
+            text="Delete",
+            command=delete_selected,
+            width=100,
+            fg_color="#ef4444",
+            hover_color="#dc2626"
+        ).pack(side="right", padx=5)
+        ctk.CTkButton(filter_frame, text="Edit", command=edit_selected, width=100).pack(side="right", padx=5)
         
-        if not events:
-            ctk.CTkLabel(
-                container,
-                text="No events found",
-                font=("Arial", 16),
-                text_color="gray"
-            ).pack(pady=40)
+        self.refresh_events_list(tree)
+    
+    def refresh_events_list(self, tree, date=None, client=None):
+        render_key = (tree, self.logger.revision, date, client)
+        if render_key == self._events_render_key:
             return
-        
-        for event in events:
-            event_card = ctk.CTkFrame(container, fg_color="#2b2b2b", corner_radius=8)
-            event_card.pack(fill="x", pady=5)
-            
-            header_frame = ctk.CTkFrame(event_card, fg_color="transparent")
-            header_frame.pack(fill="x", padx=15, pady=(10, 5))
-            
-            ctk.CTkLabel(
-                header_frame,
-                text=f"#{event['id']} - {event['client']}",
-                font=("Arial", 16, "bold")
-            ).pack(side="left")
-            
-            ctk.CTkLabel(
-                header_frame,
-                text=event['time_slot'],
-                font=("Arial", 14),
-                text_color="#3b82f6"
-            ).pack(side="left", padx=20)
-            
-            btn_frame = ctk.CTkFrame(header_frame, fg_color="transparent")
-            btn_frame.pack(side="right")
-            
-            ctk.CTkButton(
-                btn_frame,
-                text="Edit",
-                width=60,
-                height=28,
-                font=("Arial", 12),
-                command=lambda e=event: self.show_edit_event(e)
-            ).pack(side="left", padx=2)
-            
-            ctk.CTkButton(
-                btn_frame,
-                text="Delete",
-                width=60,
-                height=28,
-                font=("Arial", 12),
-                fg_color="#ef4444",
-                hover_color="#dc2626",
-                command=lambda e=event: self.delete_event(e['id'])
-            ).pack(side="left", padx=2)
-            
-            details_frame = ctk.CTkFrame(event_card, fg_color="transparent")
-            details_frame.pack(fill="x", padx=15, pady=(0, 10))
-            
-            details_text = f"Type: {event['delivery_type']} | Resource: {event['resource']} | Assigned: {event['assigned_to']}"
-            if event.get('notes'):
-                details_text += f"\nNotes: {event['notes']}"
-            
-            ctk.CTkLabel(
-                details_frame,
-                text=details_text,
-                font=("Arial", 12),
-                text_color="gray",
-                justify="left"
-            ).pack(anchor="w")
+        self._events_render_key = render_key
+        
+        tree.delete(*tree.get_children())
+        for event in self.logger.view_events(date=date, client=client):
+            tree.insert("", "end", iid=str(event.id), values=(
+                event.id,
+                event.time_slot,
+                event.client,
+                event.delivery_type,
+                event.resource,
+                event.assigned_to,
+                event.notes.replace("\n", " ")
+            ))
     
+    @batched_layout
     def show_content_add_event(self):
-        for widget in self.content_area.winfo_children():
-            widget.destroy()
+        self.clear_content()
         
         ctk.CTkLabel(
             self.content_area,
@@ -690,13 +1108,13 @@ class ModernGUI:
             command=self.show_content_events
         ).pack(side="left", padx=5)
     
+    @batched_layout
     def show_edit_event(self, event):
-        for widget in self.content_area.winfo_children():
-            widget.destroy()
+        self.clear_content()
         
         ctk.CTkLabel(
             self.content_area,
-            text=f"Edit Event #{event['id']}",
+            text=f"Edit Event #{event.id}",
             font=("Arial", 28, "bold")
         ).pack(anchor="w", pady=(0, 20))
         
@@ -706,12 +1124,12 @@ class ModernGUI:
         fields = {}
         
         field_defs = [
-            ("Time Slot", "time_slot", event.get('time_slot', '')),
-            ("Client Name", "client", event.get('client', '')),
-            ("Delivery Type", "delivery_type", event.get('delivery_type', '')),
-            ("Resource/Program", "resource", event.get('resource', '')),
-            ("Assigned To", "assigned_to", event.get('assigned_to', '')),
-            ("Alert Minutes", "alert_minutes", str(event.get('alert_minutes', 5))),
+            ("Time Slot", "time_slot", event.time_slot),
+            ("Client Name", "client", event.client),
+            ("Delivery Type", "delivery_type", event.delivery_type),
+            ("Resource/Program", "resource", event.resource),
+            ("Assigned To", "assigned_to", event.assigned_to),
+            ("Alert Minutes", "alert_minutes", str(event.alert_minutes)),
         ]
         
         for label_text, field_name, default_val in field_defs:
@@ -734,7 +1152,7 @@ class ModernGUI:
         
         notes_entry = ctk.CTkTextbox(form_frame, height=100, font=("Arial", 13))
         notes_entry.pack(fill="x", padx=20)
-        notes_entry.insert("1.0", event.get('notes', ''))
+        notes_entry.insert("1.0", event.notes)
         
         def update_event():
             try:
@@ -743,7 +1161,7 @@ class ModernGUI:
                 alert_min = 5
             
             self.logger.update_event(
-                event['id'],
+                event.id,
                 time_slot=fields['time_slot'].get(),
                 client=fields['client'].get(),
                 delivery_type=fields['delivery_type'].get(),
@@ -782,9 +1200,9 @@ class ModernGUI:
             self.logger.delete_event(event_id)
             self.show_content_events()
     
+    @batched_layout
     def show_content_users(self):
-        for widget in self.content_area.winfo_children():
-            widget.destroy()
+        self.clear_content()
         
         ctk.CTkLabel(
             self.content_area,
@@ -809,63 +1227,145 @@ class ModernGUI:
         role_menu = ctk.CTkOptionMenu(add_frame, values=["user", "admin"], variable=role_var, height=35)
         role_menu.pack(fill="x", padx=20, pady=(0, 15))
         
-        def add_user():
-            username = fields['username'].get()
-            name = fields['name'].get()
-            password = fields['password'].get()
+        error_label = ctk.CTkLabel(add_frame, text="", text_color="red", font=("Arial", 12))
+        
+        def show_error(message):
+            error_label.configure(text=message)
+            error_label.pack(padx=20, pady=(0, 10), before=create_button)
+        
+        def add_user(username_entry=fields['username'], name_entry=fields['name'],
+                     password_entry=fields['password'], role_var=role_var):
+            username = username_entry.get()
+            name = name_entry.get()
+            password = password_entry.get()
             role = role_var.get()
             
             if not username or not name or not password:
-                messagebox.showerror("Error", "All fields are required")
+                show_error("All fields are required")
                 return
             
-            if self.user_mgmt.add_user(username, password, role, name):
+            try:
+                created = self.user_mgmt.add_user(username, password, role, name)
+            except OSError as e:
+                messagebox.showerror("Error", f"Could not save user: {e}")
+                return
+            if created:
                 messagebox.showinfo("Success", "User created successfully!")
                 self.show_content_users()
             else:
-                messagebox.showerror("Error", "Username already exists")
+                show_error("Username already exists")
         
-        ctk.CTkButton(
+        create_button = ctk.CTkButton(
             add_frame,
             text="Create User",
             height=40,
             font=("Arial", 14, "bold"),
             command=add_user
-        ).pack(padx=20, pady=(0, 15))
+        )
+        create_button.pack(padx=20, pady=(0, 15))
         
         users_frame = ctk.CTkFrame(self.content_area)
-        users_frame.pack(fill="both", expand=True)
         
         ctk.CTkLabel(users_frame, text="Existing Users", font=("Arial", 18, "bold")).pack(anchor="w", padx=20, pady=(15, 10))
         
-        for username, details in self.user_mgmt.list_users().items():
-            user_card = ctk.CTkFrame(users_frame, fg_color="#2b2b2b", corner_radius=8)
-            user_card.pack(fill="x", padx=20, pady=5)
-            
-            info_frame = ctk.CTkFrame(user_card, fg_color="transparent")
-            info_frame.pack(fill="x", padx=15, pady=10)
-            
-            ctk.CTkLabel(
-                info_frame,
-                text=f"{details['name']} (@{username})",
-                font=("Arial", 15, "bold")
-            ).pack(side="left")
-            
-            role_badge_color = "#3b82f6" if details['role'] == "admin" else "#6b7280"
-            role_label = ctk.CTkLabel(
-                info_frame,
-                text=details['role'].upper(),
-                font=("Arial", 11, "bold"),
-                fg_color=role_badge_color,
-                corner_radius=6,
-                width=60,
-                height=24
-            )
-            role_label.pack(side="right")
+        list_frame = ctk.CTkFrame(users_frame, fg_color="transparent")
+        list_frame.pack(fill="both", expand=True, padx=20, pady=(0, 15))
+        
+        self._user_rows = list(self.user_mgmt.list_users().items())
+        self._user_cards = {}
+        self._users_canvas = tk.Canvas(
+            list_frame,
+            height=400,
+            bg=USERS_LIST_BG,
+            highlightthickness=0,
+            yscrollincrement=USER_ROW_HEIGHT,
+            scrollregion=(0, 0, 0, len(self._user_rows) * USER_ROW_HEIGHT)
+        )
+        scrollbar = ctk.CTkScrollbar(list_frame, command=self._users_canvas.yview)
+        self._users_canvas.configure(
+            yscrollcommand=lambda first, last: (scrollbar.set(first, last), self._refresh_visible_users())
+        )
+        scrollbar.pack(side="right", fill="y")
+        self._users_canvas.pack(side="left", fill="both", expand=True)
+        self._users_canvas.bind("<Configure>", self._on_users_canvas_configure)
+        self._tag_users_wheel(self._users_canvas)
+        self._refresh_visible_users()
+        users_frame.pack(fill="both", expand=True)
+    
+    def _on_users_canvas_configure(self, event):
+        self._users_canvas.itemconfigure("card", width=event.width)
+        self._refresh_visible_users()
+    
+    def _tag_users_wheel(self, widget):
+        widget.bindtags((USERS_WHEEL_TAG,) + widget.bindtags())
+        for child in widget.winfo_children():
+            self._tag_users_wheel(child)
+    
+    def _scroll_users(self, event):
+        self._users_canvas.yview_scroll(_wheel_step(event), "units")
+        return "break"
+    
+    def _scroll_events(self, event):
+        event.widget.yview_scroll(_wheel_step(event), "units")
+        return "break"
+    
+    def _refresh_visible_users(self):
+        if not self._users_canvas.winfo_exists():
+            return
+        top = self._users_canvas.canvasy(0)
+        bottom = top + self._users_canvas.winfo_height()
+        first = max(0, int(top // USER_ROW_HEIGHT) - USER_ROW_BUFFER)
+        last = min(len(self._user_rows), int(bottom // USER_ROW_HEIGHT) + 1 + USER_ROW_BUFFER)
+        for index in [i for i in self._user_cards if not first <= i < last]:
+            self._users_canvas.delete(f"row{index}")
+            self._user_cards.pop(index).destroy()
+        self._users_render_gen += 1
+        self._render_user_chunk(self._users_render_gen, [i for i in range(first, last) if i not in self._user_cards])
+    
+    def _render_user_chunk(self, gen, pending):
+        if gen != self._users_render_gen or not self._users_canvas.winfo_exists():
+            return
+        for index in pending[:USER_RENDER_CHUNK]:
+            self._user_cards[index] = self._make_user_card(index)
+        if len(pending) > USER_RENDER_CHUNK:
+            self.root.after_idle(self._render_user_chunk, gen, pending[USER_RENDER_CHUNK:])
+    
+    def _make_user_card(self, index, _frame=ctk.CTkFrame, _label=ctk.CTkLabel, _card_kw=USER_CARD_KW):
+        username, details = self._user_rows[index]
+        role = details['role']
+        user_card = _frame(self._users_canvas, **_card_kw)
+        self._users_canvas.create_window(
+            0, index * USER_ROW_HEIGHT, anchor="nw", window=user_card,
+            width=self._users_canvas.winfo_width(), tags=("card", f"row{index}")
+        )
+        
+        _label(
+            user_card,
+            text=details['name'] + " (@" + username + ")",
+            font=self._user_name_font
+        ).pack(side="left", padx=15, pady=10)
+        
+        role_label = _label(user_card, text=role.upper(), **self._badge_kw.get(role, self._default_badge_kw))
+        role_label.pack(side="right", padx=15, pady=10)
+        self._tag_users_wheel(user_card)
+        return user_card
     
     def export_csv(self):
-        filename = f"schedule_export_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
-        if self.logger.export_to_csv(filename):
+        filename = f"schedule_export_{time.strftime('%Y%m%d_%H%M%S')}.csv"
+        self._menu_buttons["Export CSV"].configure(state="disabled")
+        future = self._pool.submit(self.logger.export_to_csv, filename)
+        future.add_done_callback(lambda f: self.root.after(0, lambda: self._export_done(filename, f)))
+    
+    def _export_done(self, filename, future):
+        button = self._menu_buttons["Export CSV"]
+        if button.winfo_exists():
+            button.configure(state="normal")
+        try:
+            exported = future.result()
+        except OSError as e:
+            messagebox.showerror("Error", f"Export failed: {e}")
+            return
+        if exported:
             messagebox.showinfo("Success", f"Events exported to {filename}")
         else:
             messagebox.showwarning("Warning", "No events to export")
@@ -875,10 +1375,21 @@ class ModernGUI:
         self.current_user = None
         self.show_login()
     
-    def clear_window(self):
-        for widget in self.root.winfo_children():
+    def clear_root(self):
+        if self._page_container is not None:
+            self._page_container.destroy()
+        self._page_container = ctk.CTkFrame(self.root, fg_color="transparent")
+        self._page_container.pack(fill="both", expand=True)
+    
+    def clear_content(self):
+        for widget in self.content_area.winfo_children():
             widget.destroy()
     
+    def on_close(self):
+        self.logger.stop_alert_monitor()
+        self.logger.flush()
+        self.root.destroy()
+    
     def run(self):
         self.root.mainloop()
 